@@ -10,20 +10,23 @@ Protocol (UDP):
   Type: 0x01 = TX (Renode -> Python), 0x02 = RX (Python -> Renode)
 
 Usage:
-  python3 ble_bridge.py [--renode-rx-port 5001] [--renode-tx-port 5000] [--hci 0]
+  python3 ble_bridge.py [--renode-rx-port 5001] [--renode-tx-port 5000] [--hci 0] [--verbose]
 """
 
 import argparse
+import logging
 import socket
 import struct
-import select
+import selectors
 import sys
 import os
 import random
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 from enum import IntEnum
 
+logger = logging.getLogger('ble_bridge')
+
 # =============================================================================
 # BLE Constants
 # =============================================================================
@@ -51,15 +54,91 @@ class DataPduLlid(IntEnum):
     DATA_START = 0x02  # Start of L2CAP or complete PDU
     CONTROL = 0x03     # LL Control PDU
 
+# Access address MSB6 values with reasonable bit transitions (simplified
+# check: at least 2 transitions in the most significant 6 bits)
+VALID_AA_MSB6 = tuple(v for v in range(64) if (v ^ (v >> 1)).bit_count() >= 2)
+
+# Valid hopIncrement values for CONNECT_IND (5..16)
+HOP_INCREMENTS = tuple(range(5, 17))
+
+# Plain-int copies of the enum values compared per packet, so the hot path
+# skips the enum attribute lookup and IntEnum comparison
+_CONNECT_IND = int(AdvPduType.CONNECT_IND)
+_LLID_DATA_CONT = int(DataPduLlid.DATA_CONT)
+_LLID_DATA_START = int(DataPduLlid.DATA_START)
+_LLID_CONTROL = int(DataPduLlid.CONTROL)
+
+# LLIDs carrying L2CAP data, as a bit mask indexed by LLID
+_LLID_DATA_MASK = (1 << _LLID_DATA_START) | (1 << _LLID_DATA_CONT)
+
 # Packet types for our UDP protocol
 PKT_TYPE_TX = 0x01  # Renode -> Python
 PKT_TYPE_RX = 0x02  # Python -> Renode
 
+# Max datagrams drained from the Renode socket per wake-up, so a burst from
+# Renode cannot starve the HCI socket
+RENODE_RX_BATCH = 32
+# Same bound for packets drained from the HCI socket per wake-up
+HCI_RX_BATCH = 32
+
+# Size of the preallocated per-socket receive buffers
+RX_BUF_SIZE = 4096
+
+# Kernel socket buffer size for the Renode UDP sockets, to absorb L2CAP
+# fragment bursts during commissioning (capped by net.core.[rw]mem_max)
+RENODE_SOCK_BUF_SIZE = 4 << 20
+
+# =============================================================================
+# Wire formats (pre-compiled, used on every packet)
+# =============================================================================
+
+_PKT_HDR = struct.Struct('<BBH')            # UDP header: type, channel, length
+_PKT_HDR_TAIL = struct.Struct('<BH')        # UDP header after the type byte
+_ACL_HDR = struct.Struct('<HH')             # HCI ACL: handle+flags, length
+_HCI_ACL_PKT_HDR = struct.Struct('<BHH')    # HCI_ACLDATA_PKT, handle+flags, length
+_LE_CONN_COMPLETE = struct.Struct('<BHBB6sHHH')  # status .. supervision timeout
+_LE_ENH_CONN_COMPLETE = struct.Struct('<BHBB6s12xHHH')  # same, RPAs skipped
+_DISCONN_COMPLETE = struct.Struct('<BHB')   # status, handle, reason
+_DATA_PDU_HDR = struct.Struct('<IH')        # data channel frame: AA, PDU header
+_BLE_FRAME_HDR = struct.Struct('<IBB')      # any BLE frame: AA, header byte, length
+_HCI_CMD_HDR = struct.Struct('<BHB')        # HCI_COMMAND_PKT, opcode, param length
+_HCI_ADV_DATA = struct.Struct('<B31s')      # LE Set Adv/Scan Rsp Data params
+_HCI_ADV_PARAMS = struct.Struct('<HHBBB6sBB')  # LE Set Advertising Parameters
+
+# Full CONNECT_IND frame:
+#   Access Address (4) + PDU Header (1) + Length (1) + Payload (34) + CRC (3)
+# LLData: AA (4), CRCInit (3), WinSize (1), WinOffset (2), Interval (2),
+#         Latency (2), Timeout (2), ChM (5), Hop[4:0] + SCA[7:5] (1)
+# The CRC is a zero placeholder (Renode should recalculate).
+_CONNECT_IND_FRAME = struct.Struct('<IBB6s6sI3sBHHHH5sB3x')
+CONNECT_IND_PDU_LEN = _CONNECT_IND_FRAME.size - 9
+
+
+def _hci_command(ogf: int, ocf: int, params: bytes = b'') -> bytes:
+    """Build an HCI command packet: [pkt_type:1][opcode:2][len:1][params]."""
+    return _HCI_CMD_HDR.pack(0x01, (ogf << 10) | ocf, len(params)) + params
+
+
+# Constant HCI commands, built once
+_LE_SET_ADV_PARAMS_CMD = _hci_command(0x08, 0x0006, _HCI_ADV_PARAMS.pack(
+    0x0100,     # min_interval (160ms)
+    0x0100,     # max_interval (160ms)
+    0x00,       # ADV_IND (connectable undirected)
+    0x00,       # Own address type (public)
+    0x00,       # Peer address type
+    b'\x00' * 6,  # Peer address
+    0x07,       # All advertising channels
+    0x00        # Filter policy
+))
+# Indexed by the enable flag
+_LE_SET_ADV_ENABLE_CMD = (_hci_command(0x08, 0x000A, b'\x00'),
+                          _hci_command(0x08, 0x000A, b'\x01'))
+
 # =============================================================================
 # Connection State
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionState:
     """Track state for an active BLE connection."""
     # Connection identifiers
@@ -68,15 +147,21 @@ class ConnectionState:
     crc_init: int = 0
 
     # Addresses
-    init_addr: bytes = field(default_factory=lambda: b'\x00' * 6)
+    init_addr: bytes = b'\x00' * 6
     init_addr_type: int = 0
-    adv_addr: bytes = field(default_factory=lambda: b'\x00' * 6)
+    adv_addr: bytes = b'\x00' * 6
     adv_addr_type: int = 0
 
     # Channel hopping
-    channel_map: bytes = field(default_factory=lambda: b'\xff\xff\xff\xff\x1f')  # All 37 data channels
+    channel_map: bytes = b'\xff\xff\xff\xff\x1f'  # All 37 data channels
     hop_increment: int = 5
     unmapped_channels: List[int] = field(default_factory=list)
+    # Hop algorithm lookups, rebuilt with unmapped_channels:
+    # per-channel membership mask (1 = channel used) and the remap table
+    _channel_used: bytearray = field(default_factory=lambda: bytearray(37),
+                                     init=False, repr=False, compare=False)
+    _remap_table: tuple = field(default=(), init=False, repr=False, compare=False)
+    _remap_len: int = field(default=0, init=False, repr=False, compare=False)
 
     # Timing
     interval: int = 0x0018  # 30ms (units of 1.25ms)
@@ -100,26 +185,27 @@ class ConnectionState:
 
     def _build_channel_list(self):
         """Build list of used data channels from channel map."""
-        self.unmapped_channels = []
-        for i in range(37):
-            byte_idx = i // 8
-            bit_idx = i % 8
-            if self.channel_map[byte_idx] & (1 << bit_idx):
-                self.unmapped_channels.append(i)
+        # ChM is a 37-bit little-endian bit field, one bit per data channel
+        chm = int.from_bytes(self.channel_map, 'little')
+        self.unmapped_channels = [i for i in range(37) if (chm >> i) & 1]
         if not self.unmapped_channels:
             self.unmapped_channels = list(range(37))
 
+        self._channel_used = bytearray(37)
+        for i in self.unmapped_channels:
+            self._channel_used[i] = 1
+        self._remap_table = tuple(self.unmapped_channels)
+        self._remap_len = len(self._remap_table)
+
     def next_channel(self) -> int:
         """Calculate next data channel using hop algorithm."""
-        unmapped = (self.current_channel + self.hop_increment) % 37
-        if unmapped in self.unmapped_channels:
-            self.current_channel = unmapped
-        else:
+        channel = (self.current_channel + self.hop_increment) % 37
+        if not self._channel_used[channel]:
             # Remap to used channel
-            idx = unmapped % len(self.unmapped_channels)
-            self.current_channel = self.unmapped_channels[idx]
+            channel = self._remap_table[channel % self._remap_len]
+        self.current_channel = channel
         self.event_counter += 1
-        return self.current_channel
+        return channel
 
 # =============================================================================
 # BLE Bridge
@@ -136,35 +222,78 @@ class BLEBridge:
 
         # Renode UDP sockets
         self.renode_rx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.renode_rx_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RENODE_SOCK_BUF_SIZE)
         self.renode_rx_sock.bind(('127.0.0.1', renode_rx_port))
         self.renode_rx_sock.setblocking(False)
 
         self.renode_tx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.renode_tx_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, RENODE_SOCK_BUF_SIZE)
+        # Connected UDP socket: the destination is resolved once, send() reuses it
+        self.renode_tx_sock.connect(('127.0.0.1', renode_tx_port))
+
+        # Receive buffers reused for every packet; handlers get memoryview
+        # slices into them and must copy anything they keep (bytes(...)).
+        self._rx_buf = bytearray(RX_BUF_SIZE)
+        self._rx_mv = memoryview(self._rx_buf)
+        self._hci_rx_buf = bytearray(RX_BUF_SIZE)
+        self._hci_rx_mv = memoryview(self._hci_rx_buf)
+        # Data frames to Renode are built in place here; sized so a full
+        # HCI ACL payload plus AA, header and CRC always fits.
+        self._tx_buf = bytearray(RX_BUF_SIZE + 16)
+        self._tx_mv = memoryview(self._tx_buf)
+        self._udp_tx_hdr = bytearray(_PKT_HDR.size)
+        self._udp_tx_hdr[0] = PKT_TYPE_RX
+        # HCI ACL header, sent ahead of the payload in one sendmsg()
+        self._hci_acl_hdr = bytearray(_HCI_ACL_PKT_HDR.size)
+        # LE Set Advertising / Scan Response Data commands; the header is
+        # fixed, only the 32-byte parameter block is rewritten per update
+        self._adv_data_cmd = bytearray(_hci_command(0x08, 0x0008, bytes(_HCI_ADV_DATA.size)))
+        self._scan_rsp_cmd = bytearray(_hci_command(0x08, 0x0009, bytes(_HCI_ADV_DATA.size)))
 
         # HCI socket (optional, for real BlueZ integration)
         self.hci_sock: Optional[socket.socket] = None
         if not dry_run:
             try:
                 self.hci_sock = self._open_hci_socket(hci_dev)
-                print(f"[INFO] Connected to hci{hci_dev}")
-            except Exception as e:
-                print(f"[WARN] Failed to open HCI socket: {e}")
-                print("[WARN] Running in dry-run mode (no BlueZ connection)")
+                logger.info("[INFO] Connected to hci%d", hci_dev)
+            except OSError as e:
+                logger.warning("[WARN] Failed to open HCI socket: %s", e)
+                logger.warning("[WARN] Running in dry-run mode (no BlueZ connection)")
                 self.dry_run = True
 
+        # Event loop: sockets stay registered with the kernel (epoll on Linux)
+        # and each key carries its handler, so run() needs no fd comparisons.
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.renode_rx_sock, selectors.EVENT_READ, self._handle_renode_frame)
+        if self.hci_sock:
+            self._sel.register(self.hci_sock, selectors.EVENT_READ, self._handle_hci_packet)
+
+        # Advertising PDU type -> handler. The type is a 4-bit field, so a
+        # 16-slot table indexed directly replaces hashing (None = ignored).
+        adv_handlers = [None] * 16
+        adv_handlers[AdvPduType.ADV_IND] = self._handle_adv_ind
+        adv_handlers[AdvPduType.ADV_NONCONN_IND] = self._handle_adv_ind
+        adv_handlers[AdvPduType.ADV_SCAN_IND] = self._handle_adv_ind
+        adv_handlers[AdvPduType.SCAN_RSP] = self._handle_scan_rsp
+        self._adv_handlers = tuple(adv_handlers)
+
         # Advertising state
         self.advertising_enabled = False
         self.current_adv_data: Optional[bytes] = None
+        self._adv_data_pending = False
+        self.current_scan_rsp_data: Optional[bytes] = None
         self.adv_addr: bytes = b'\x00' * 6
 
-        # Connection tracking: conn_handle -> ConnectionState
-        self.connections: Dict[int, ConnectionState] = {}
-        # Access address -> conn_handle mapping
-        self.access_addr_map: Dict[int, int] = {}
+        # Connection tracking, indexed by conn_handle (None = free slot).
+        # Handles are small and dense, so a list beats hashing per packet;
+        # it grows on demand in _create_connection().
+        self.connections: List[Optional[ConnectionState]] = [None] * 16
+        # Access address -> connection, so data frames resolve in one lookup
+        self.access_addr_map: Dict[int, ConnectionState] = {}
 
-        print(f"[INFO] BLE Bridge started")
-        print(f"[INFO]   Renode RX (from Renode): UDP port {renode_rx_port}")
-        print(f"[INFO]   Renode TX (to Renode): UDP port {renode_tx_port}")
+        logger.info("[INFO] BLE Bridge started")
+        logger.info("[INFO]   Renode RX (from Renode): UDP port %d", renode_rx_port)
+        logger.info("[INFO]   Renode TX (to Renode): UDP port %d", renode_tx_port)
 
     def _open_hci_socket(self, dev_id: int) -> socket.socket:
         """Open raw HCI socket to BlueZ."""
@@ -193,40 +322,45 @@ class BLEBridge:
 
     def run(self):
         """Main event loop."""
-        sockets = [self.renode_rx_sock]
-        if self.hci_sock:
-            sockets.append(self.hci_sock)
-
-        print("[INFO] Entering main loop... (Ctrl+C to exit)")
+        logger.info("[INFO] Entering main loop... (Ctrl+C to exit)")
 
+        select = self._sel.select
         try:
             while True:
-                readable, _, _ = select.select(sockets, [], [], 0.1)
-
-                for sock in readable:
-                    if sock == self.renode_rx_sock:
-                        self._handle_renode_frame()
-                    elif sock == self.hci_sock:
-                        self._handle_hci_packet()
+                for key, _ in select():
+                    key.data()
         except KeyboardInterrupt:
-            print("\n[INFO] Shutting down...")
+            logger.info("\n[INFO] Shutting down...")
+        finally:
+            self._sel.close()
 
     # =========================================================================
     # Renode -> Python handlers
     # =========================================================================
 
     def _handle_renode_frame(self):
-        """Handle frame received from Renode."""
-        try:
-            data, addr = self.renode_rx_sock.recvfrom(1024)
-        except BlockingIOError:
-            return
+        """Drain frames received from Renode."""
+        recvfrom_into = self.renode_rx_sock.recvfrom_into
+        rx_buf = self._rx_buf
+        rx_mv = self._rx_mv
+        for _ in range(RENODE_RX_BATCH):
+            try:
+                nbytes, addr = recvfrom_into(rx_buf)
+            except BlockingIOError:
+                break
+            self._dispatch_renode_frame(rx_mv[:nbytes])
 
+        # Apply only the newest advertising data seen in this batch
+        if self._adv_data_pending:
+            self._apply_advertising_data()
+
+    def _dispatch_renode_frame(self, data: memoryview):
+        """Parse a single Renode UDP packet and dispatch its BLE frame."""
         if len(data) < 4:
-            print(f"[WARN] Packet too short: {len(data)} bytes")
+            logger.warning("[WARN] Packet too short: %d bytes", len(data))
             return
 
-        pkt_type, channel, length = struct.unpack('<BBH', data[:4])
+        pkt_type, channel, length = _PKT_HDR.unpack_from(data, 0)
         ble_frame = data[4:4+length]
 
         if pkt_type != PKT_TYPE_TX:
@@ -236,36 +370,30 @@ class BLEBridge:
         if len(ble_frame) < 6:
             return
 
-        access_addr = struct.unpack('<I', ble_frame[0:4])[0]
+        # Advertising and data PDUs share the layout of the first 6 bytes
+        access_addr, pdu_header, pdu_length = _BLE_FRAME_HDR.unpack_from(ble_frame, 0)
 
         if access_addr == BLE_ADV_ACCESS_ADDR:
-            self._handle_adv_frame(channel, ble_frame)
+            self._handle_adv_frame(channel, pdu_header, pdu_length, ble_frame)
         else:
-            self._handle_data_frame(access_addr, channel, ble_frame)
+            self._handle_data_frame(access_addr, channel, pdu_header, pdu_length, ble_frame)
 
-    def _handle_adv_frame(self, channel: int, frame: bytes):
+    def _handle_adv_frame(self, channel: int, pdu_header: int, pdu_length: int,
+                          frame: memoryview):
         """Handle advertising channel frame from Renode."""
-        pdu_header = frame[4]
         pdu_type = pdu_header & 0x0F
         tx_add = (pdu_header >> 6) & 0x01
-        rx_add = (pdu_header >> 7) & 0x01
-        pdu_length = frame[5]
 
         if pdu_length + 6 > len(frame):
             return
 
         pdu_payload = frame[6:6+pdu_length]
 
-        if pdu_type == AdvPduType.ADV_IND:
-            self._handle_adv_ind(channel, tx_add, pdu_payload)
-        elif pdu_type == AdvPduType.ADV_NONCONN_IND:
-            self._handle_adv_ind(channel, tx_add, pdu_payload)
-        elif pdu_type == AdvPduType.ADV_SCAN_IND:
-            self._handle_adv_ind(channel, tx_add, pdu_payload)
-        elif pdu_type == AdvPduType.SCAN_RSP:
-            self._handle_scan_rsp(channel, tx_add, pdu_payload)
+        handler = self._adv_handlers[pdu_type]
+        if handler:
+            handler(channel, tx_add, pdu_payload)
 
-    def _handle_adv_ind(self, channel: int, tx_add: int, payload: bytes):
+    def _handle_adv_ind(self, channel: int, tx_add: int, payload: memoryview):
         """Handle ADV_IND/ADV_NONCONN_IND from Renode."""
         if len(payload) < 6:
             return
@@ -273,20 +401,27 @@ class BLEBridge:
         adv_addr = payload[0:6]
         ad_data = payload[6:]
 
-        self.adv_addr = adv_addr
-        print(f"[RX ADV] ch={channel}, addr={adv_addr.hex()}, ad_len={len(ad_data)}")
+        if adv_addr != self.adv_addr:
+            self.adv_addr = bytes(adv_addr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[RX ADV] ch=%d, addr=%s, ad_len=%d", channel, adv_addr.hex(), len(ad_data))
 
-        # Update advertising data if changed
+        # Update advertising data if changed (applied once per RX batch)
         if ad_data != self.current_adv_data:
-            self.current_adv_data = ad_data
-            self._set_hci_advertising_data(ad_data)
+            self.current_adv_data = bytes(ad_data)
+            self._adv_data_pending = True
+
+    def _apply_advertising_data(self):
+        """Push current_adv_data to the controller, enabling advertising once."""
+        self._adv_data_pending = False
+        self._set_hci_advertising_data(self.current_adv_data)
 
-            if not self.advertising_enabled:
-                self._set_hci_advertising_params()
-                self._enable_hci_advertising(True)
-                self.advertising_enabled = True
+        if not self.advertising_enabled:
+            self._set_hci_advertising_params()
+            self._enable_hci_advertising(True)
+            self.advertising_enabled = True
 
-    def _handle_scan_rsp(self, channel: int, tx_add: int, payload: bytes):
+    def _handle_scan_rsp(self, channel: int, tx_add: int, payload: memoryview):
         """Handle SCAN_RSP from Renode."""
         if len(payload) < 6:
             return
@@ -294,47 +429,43 @@ class BLEBridge:
         adv_addr = payload[0:6]
         scan_rsp_data = payload[6:]
 
-        print(f"[RX SCAN_RSP] ch={channel}, addr={adv_addr.hex()}, len={len(scan_rsp_data)}")
-        self._set_hci_scan_response_data(scan_rsp_data)
-
-    def _handle_data_frame(self, access_addr: int, channel: int, frame: bytes):
-        """Handle data channel frame from Renode."""
-        if access_addr not in self.access_addr_map:
-            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[RX SCAN_RSP] ch=%d, addr=%s, len=%d",
+                         channel, adv_addr.hex(), len(scan_rsp_data))
 
-        conn_handle = self.access_addr_map[access_addr]
-        conn = self.connections.get(conn_handle)
-        if not conn:
-            return
+        # Renode repeats the same SCAN_RSP; only reprogram the controller on change
+        if scan_rsp_data != self.current_scan_rsp_data:
+            self.current_scan_rsp_data = bytes(scan_rsp_data)
+            self._set_hci_scan_response_data(self.current_scan_rsp_data)
 
-        # Parse data PDU header
-        # [Access Addr:4][Header:2][Payload:N][CRC:3]
-        if len(frame) < 6:
+    def _handle_data_frame(self, access_addr: int, channel: int, hdr0: int, length: int,
+                           frame: memoryview):
+        """Handle data channel frame from Renode."""
+        conn = self.access_addr_map.get(access_addr)
+        if conn is None:
             return
 
-        header = struct.unpack('<H', frame[4:6])[0]
-        llid = header & 0x03
-        nesn = (header >> 2) & 0x01
-        sn = (header >> 3) & 0x01
-        md = (header >> 4) & 0x01
-        length = (header >> 8) & 0xFF
+        # Data PDU: [Access Addr:4][Header:2][Payload:N][CRC:3]
+        # Header byte 0: LLID[1:0] NESN[2] SN[3] MD[4]; byte 1: length
+        llid = hdr0 & 0x03
 
         payload = frame[6:6+length]
 
-        print(f"[RX DATA] handle=0x{conn_handle:04X}, llid={llid}, sn={sn}, nesn={nesn}, len={length}")
+        logger.debug("[RX DATA] handle=0x%04X, llid=%d, sn=%d, nesn=%d, len=%d",
+                     conn.conn_handle, llid, (hdr0 >> 3) & 0x01, (hdr0 >> 2) & 0x01, length)
 
-        if llid == DataPduLlid.CONTROL:
+        if llid == _LLID_CONTROL:
             self._handle_ll_control(conn, payload)
-        elif llid in [DataPduLlid.DATA_START, DataPduLlid.DATA_CONT]:
+        elif (_LLID_DATA_MASK >> llid) & 1:
             self._forward_data_to_hci(conn, llid, payload)
 
-    def _handle_ll_control(self, conn: ConnectionState, payload: bytes):
+    def _handle_ll_control(self, conn: ConnectionState, payload: memoryview):
         """Handle LL Control PDU."""
         if len(payload) < 1:
             return
 
         opcode = payload[0]
-        print(f"  [LL CTRL] opcode=0x{opcode:02X}")
+        logger.debug("  [LL CTRL] opcode=0x%02X", opcode)
 
         # Common LL Control opcodes
         LL_CONNECTION_UPDATE_IND = 0x00
@@ -347,46 +478,55 @@ class BLEBridge:
         LL_LENGTH_RSP = 0x15
 
         if opcode == LL_TERMINATE_IND:
-            print(f"  [LL CTRL] Connection terminated")
+            logger.info("  [LL CTRL] Connection terminated")
             self._handle_disconnect(conn)
 
-    def _forward_data_to_hci(self, conn: ConnectionState, llid: int, payload: bytes):
+    def _forward_data_to_hci(self, conn: ConnectionState, llid: int, payload: memoryview):
         """Forward BLE LL data to HCI ACL."""
         if self.dry_run or not self.hci_sock:
-            print(f"  [DRY-RUN] Would forward {len(payload)} bytes to HCI")
+            logger.debug("  [DRY-RUN] Would forward %d bytes to HCI", len(payload))
             return
 
         # Build HCI ACL Data packet
         # [pkt_type:1][handle+flags:2][length:2][data:N]
 
         # Packet boundary flag: 0x02 = first packet (start), 0x01 = continuing
-        pb_flag = 0x02 if llid == DataPduLlid.DATA_START else 0x01
+        pb_flag = 0x02 if llid == _LLID_DATA_START else 0x01
         bc_flag = 0x00  # Point-to-point
 
         handle_flags = (conn.conn_handle & 0x0FFF) | (pb_flag << 12) | (bc_flag << 14)
 
-        hci_pkt = struct.pack('<BHH', 0x02, handle_flags, len(payload)) + payload
+        hdr = self._hci_acl_hdr
+        _HCI_ACL_PKT_HDR.pack_into(hdr, 0, 0x02, handle_flags, len(payload))
 
         try:
-            self.hci_sock.send(hci_pkt)
-            print(f"  [HCI TX] ACL data, handle=0x{conn.conn_handle:04X}, len={len(payload)}")
-        except Exception as e:
-            print(f"  [ERROR] Failed to send HCI ACL: {e}")
+            # Scatter-gather: the payload view goes to the kernel uncopied
+            self.hci_sock.sendmsg((hdr, payload))
+            logger.debug("  [HCI TX] ACL data, handle=0x%04X, len=%d", conn.conn_handle, len(payload))
+        except OSError as e:
+            logger.error("  [ERROR] Failed to send HCI ACL: %s", e)
 
     # =========================================================================
     # HCI -> Python handlers
     # =========================================================================
 
     def _handle_hci_packet(self):
-        """Handle HCI packet from BlueZ."""
+        """Drain packets received from BlueZ."""
         if not self.hci_sock:
             return
 
-        try:
-            data = self.hci_sock.recv(1024)
-        except BlockingIOError:
-            return
+        recv_into = self.hci_sock.recv_into
+        rx_buf = self._hci_rx_buf
+        rx_mv = self._hci_rx_mv
+        for _ in range(HCI_RX_BATCH):
+            try:
+                nbytes = recv_into(rx_buf)
+            except BlockingIOError:
+                break
+            self._dispatch_hci_packet(rx_mv[:nbytes])
 
+    def _dispatch_hci_packet(self, data: memoryview):
+        """Handle a single HCI packet from BlueZ."""
         if len(data) < 1:
             return
 
@@ -397,7 +537,7 @@ class BLEBridge:
         elif pkt_type == 0x02:  # HCI_ACLDATA_PKT
             self._handle_hci_acl_data(data[1:])
 
-    def _handle_hci_event(self, data: bytes):
+    def _handle_hci_event(self, data: memoryview):
         """Handle HCI Event packet."""
         if len(data) < 2:
             return
@@ -411,7 +551,7 @@ class BLEBridge:
         elif event_code == 0x05:  # Disconnection Complete
             self._handle_disconnection_complete(params)
 
-    def _handle_le_meta_event(self, params: bytes):
+    def _handle_le_meta_event(self, params: memoryview):
         """Handle LE Meta Event."""
         if len(params) < 1:
             return
@@ -423,23 +563,17 @@ class BLEBridge:
         elif subevent == 0x0A:  # LE Enhanced Connection Complete
             self._handle_le_enhanced_connection_complete(params[1:])
 
-    def _handle_le_connection_complete(self, params: bytes):
+    def _handle_le_connection_complete(self, params: memoryview):
         """Handle LE Connection Complete event."""
         if len(params) < 18:
             return
 
-        status = params[0]
-        conn_handle = struct.unpack('<H', params[1:3])[0]
-        role = params[3]
-        peer_addr_type = params[4]
-        peer_addr = params[5:11]
-        conn_interval = struct.unpack('<H', params[11:13])[0]
-        conn_latency = struct.unpack('<H', params[13:15])[0]
-        supervision_timeout = struct.unpack('<H', params[15:17])[0]
+        (status, conn_handle, role, peer_addr_type, peer_addr,
+         conn_interval, conn_latency, supervision_timeout) = _LE_CONN_COMPLETE.unpack_from(params, 0)
 
-        print(f"[HCI LE Conn Complete] status={status}, handle=0x{conn_handle:04X}")
-        print(f"  role={role}, peer={peer_addr.hex()}")
-        print(f"  interval={conn_interval}, latency={conn_latency}, timeout={supervision_timeout}")
+        logger.info("[HCI LE Conn Complete] status=%d, handle=0x%04X", status, conn_handle)
+        logger.info("  role=%d, peer=%s", role, peer_addr.hex())
+        logger.info("  interval=%d, latency=%d, timeout=%d", conn_interval, conn_latency, supervision_timeout)
 
         if status != 0:
             return
@@ -451,24 +585,17 @@ class BLEBridge:
         # Generate and send CONNECT_IND to Renode
         self._send_connect_ind_to_renode(conn)
 
-    def _handle_le_enhanced_connection_complete(self, params: bytes):
+    def _handle_le_enhanced_connection_complete(self, params: memoryview):
         """Handle LE Enhanced Connection Complete (for BT 4.2+)."""
         # Similar to regular connection complete, with additional fields
         if len(params) < 30:
             return
 
-        status = params[0]
-        conn_handle = struct.unpack('<H', params[1:3])[0]
-        role = params[3]
-        peer_addr_type = params[4]
-        peer_addr = params[5:11]
-        # local_resolvable_private_addr = params[11:17]
-        # peer_resolvable_private_addr = params[17:23]
-        conn_interval = struct.unpack('<H', params[23:25])[0]
-        conn_latency = struct.unpack('<H', params[25:27])[0]
-        supervision_timeout = struct.unpack('<H', params[27:29])[0]
+        # Local/peer resolvable private addresses (params[11:23]) are skipped
+        (status, conn_handle, role, peer_addr_type, peer_addr,
+         conn_interval, conn_latency, supervision_timeout) = _LE_ENH_CONN_COMPLETE.unpack_from(params, 0)
 
-        print(f"[HCI LE Enhanced Conn Complete] status={status}, handle=0x{conn_handle:04X}")
+        logger.info("[HCI LE Enhanced Conn Complete] status=%d, handle=0x%04X", status, conn_handle)
 
         if status != 0:
             return
@@ -477,39 +604,38 @@ class BLEBridge:
                                         conn_interval, conn_latency, supervision_timeout)
         self._send_connect_ind_to_renode(conn)
 
-    def _handle_disconnection_complete(self, params: bytes):
+    def _handle_disconnection_complete(self, params: memoryview):
         """Handle Disconnection Complete event."""
         if len(params) < 4:
             return
 
-        status = params[0]
-        conn_handle = struct.unpack('<H', params[1:3])[0]
-        reason = params[3]
+        status, conn_handle, reason = _DISCONN_COMPLETE.unpack_from(params, 0)
 
-        print(f"[HCI Disconnect] handle=0x{conn_handle:04X}, reason=0x{reason:02X}")
+        logger.info("[HCI Disconnect] handle=0x%04X, reason=0x%02X", conn_handle, reason)
 
-        conn = self.connections.get(conn_handle)
+        connections = self.connections
+        conn = connections[conn_handle] if conn_handle < len(connections) else None
         if conn:
             self._handle_disconnect(conn)
 
-    def _handle_hci_acl_data(self, data: bytes):
+    def _handle_hci_acl_data(self, data: memoryview):
         """Handle HCI ACL Data packet from BlueZ."""
         if len(data) < 4:
             return
 
-        handle_flags = struct.unpack('<H', data[0:2])[0]
-        length = struct.unpack('<H', data[2:4])[0]
+        handle_flags, length = _ACL_HDR.unpack_from(data, 0)
         payload = data[4:4+length]
 
         conn_handle = handle_flags & 0x0FFF
         pb_flag = (handle_flags >> 12) & 0x03
         bc_flag = (handle_flags >> 14) & 0x03
 
-        print(f"[HCI ACL RX] handle=0x{conn_handle:04X}, pb={pb_flag}, len={length}")
+        logger.debug("[HCI ACL RX] handle=0x%04X, pb=%d, len=%d", conn_handle, pb_flag, length)
 
-        conn = self.connections.get(conn_handle)
+        connections = self.connections
+        conn = connections[conn_handle] if conn_handle < len(connections) else None
         if not conn:
-            print(f"  [WARN] Unknown connection handle")
+            logger.warning("  [WARN] Unknown connection handle")
             return
 
         # Convert to BLE LL data PDU and send to Renode
@@ -526,7 +652,7 @@ class BLEBridge:
         access_addr = self._generate_access_address()
 
         # Generate random CRC init
-        crc_init = random.randint(0, 0xFFFFFF)
+        crc_init = random.getrandbits(24)
 
         conn = ConnectionState(
             conn_handle=conn_handle,
@@ -538,129 +664,126 @@ class BLEBridge:
             interval=interval,
             latency=latency,
             timeout=timeout,
-            hop_increment=random.randint(5, 16),
+            hop_increment=random.choice(HOP_INCREMENTS),
             is_connected=True,
         )
 
+        if conn_handle >= len(self.connections):
+            self.connections.extend([None] * (conn_handle + 1 - len(self.connections)))
+        old = self.connections[conn_handle]
+        if old is not None:
+            # Handle reused without a disconnect; stop routing its old AA
+            self.access_addr_map.pop(old.access_addr, None)
         self.connections[conn_handle] = conn
-        self.access_addr_map[access_addr] = conn_handle
+        self.access_addr_map[access_addr] = conn
 
-        print(f"[CONN] Created connection: handle=0x{conn_handle:04X}, aa=0x{access_addr:08X}")
+        logger.info("[CONN] Created connection: handle=0x%04X, aa=0x%08X", conn_handle, access_addr)
 
         return conn
 
     def _generate_access_address(self) -> int:
         """Generate valid BLE access address."""
         while True:
-            aa = random.randint(0, 0xFFFFFFFF)
-
-            # Must not be advertising access address
-            if aa == BLE_ADV_ACCESS_ADDR:
-                continue
-
-            # Should have reasonable bit transitions (simplified check)
-            # At least 2 transitions in most significant 6 bits
-            msb6 = (aa >> 26) & 0x3F
-            transitions = bin(msb6 ^ (msb6 >> 1)).count('1')
-            if transitions < 2:
-                continue
+            # Draw the most significant 6 bits from the precomputed valid set,
+            # which also rules out the all-zeros/all-ones addresses
+            aa = (random.choice(VALID_AA_MSB6) << 26) | random.getrandbits(26)
 
-            # Should not have all same bits
-            if aa == 0x00000000 or aa == 0xFFFFFFFF:
+            # Must not be advertising access address or already in use
+            if aa == BLE_ADV_ACCESS_ADDR or aa in self.access_addr_map:
                 continue
 
             return aa
 
     def _handle_disconnect(self, conn: ConnectionState):
         """Handle connection disconnection."""
-        print(f"[CONN] Disconnected: handle=0x{conn.conn_handle:04X}")
+        logger.info("[CONN] Disconnected: handle=0x%04X", conn.conn_handle)
 
         # Send LL_TERMINATE_IND to Renode
         self._send_ll_terminate_to_renode(conn)
 
         # Clean up
-        if conn.access_addr in self.access_addr_map:
+        if self.access_addr_map.get(conn.access_addr) is conn:
             del self.access_addr_map[conn.access_addr]
-        if conn.conn_handle in self.connections:
-            del self.connections[conn.conn_handle]
+        if self.connections[conn.conn_handle] is conn:
+            self.connections[conn.conn_handle] = None
 
     # =========================================================================
     # Send to Renode
     # =========================================================================
 
-    def _send_to_renode(self, channel: int, frame: bytes):
+    def _send_to_renode(self, channel: int, frame: Union[bytes, memoryview]):
         """Send BLE frame to Renode via UDP."""
-        packet = struct.pack('<BBH', PKT_TYPE_RX, channel, len(frame)) + frame
-        self.renode_tx_sock.sendto(packet, ('127.0.0.1', self.renode_tx_port))
+        # Only channel and length vary; the type byte is preset in __init__.
+        # Header and frame go out as one datagram via scatter-gather, so the
+        # frame is never copied into a new packet.
+        hdr = self._udp_tx_hdr
+        _PKT_HDR_TAIL.pack_into(hdr, 1, channel, len(frame))
+        try:
+            self.renode_tx_sock.sendmsg((hdr, frame))
+        except ConnectionRefusedError:
+            # A connected UDP socket reports ICMP port unreachable from an
+            # earlier send; Renode is not listening (yet), drop the frame
+            logger.warning("[WARN] Renode not listening on UDP port %d, frame dropped",
+                           self.renode_tx_port)
 
     def _send_connect_ind_to_renode(self, conn: ConnectionState):
         """Send CONNECT_IND PDU to Renode."""
-        print(f"[TX CONNECT_IND] aa=0x{conn.access_addr:08X}")
+        logger.info("[TX CONNECT_IND] aa=0x%08X", conn.access_addr)
 
-        # Build CONNECT_IND PDU
+        # Build CONNECT_IND frame in one pack (layout: _CONNECT_IND_FRAME)
         # PDU payload: InitA (6) + AdvA (6) + LLData (22) = 34 bytes
 
-        # LLData structure:
-        # - AA (4 bytes): Access Address
-        # - CRCInit (3 bytes)
-        # - WinSize (1 byte)
-        # - WinOffset (2 bytes)
-        # - Interval (2 bytes)
-        # - Latency (2 bytes)
-        # - Timeout (2 bytes)
-        # - ChM (5 bytes): Channel Map
-        # - Hop + SCA (1 byte): Hop[4:0] + SCA[7:5]
-
-        ll_data = struct.pack('<I', conn.access_addr)  # AA
-        ll_data += struct.pack('<I', conn.crc_init)[:3]  # CRCInit (3 bytes)
-        ll_data += struct.pack('<B', conn.win_size)  # WinSize
-        ll_data += struct.pack('<H', conn.win_offset)  # WinOffset
-        ll_data += struct.pack('<H', conn.interval)  # Interval
-        ll_data += struct.pack('<H', conn.latency)  # Latency
-        ll_data += struct.pack('<H', conn.timeout)  # Timeout
-        ll_data += conn.channel_map  # ChM (5 bytes)
-        ll_data += struct.pack('<B', (conn.hop_increment & 0x1F) | (0 << 5))  # Hop + SCA
-
-        # PDU payload = InitA + AdvA + LLData
-        pdu_payload = conn.init_addr + conn.adv_addr + ll_data
-
         # PDU header: type=CONNECT_IND (0x05), TxAdd, RxAdd
         # TxAdd=0 (public initiator), RxAdd based on advertiser
-        pdu_header = AdvPduType.CONNECT_IND | (conn.init_addr_type << 6) | (0 << 7)
-        pdu_length = len(pdu_payload)
-
-        # Full BLE frame: Access Address (4) + PDU Header (1) + Length (1) + Payload + CRC (3)
-        frame = struct.pack('<I', BLE_ADV_ACCESS_ADDR)
-        frame += struct.pack('<BB', pdu_header, pdu_length)
-        frame += pdu_payload
-        frame += b'\x00\x00\x00'  # Placeholder CRC (Renode should recalculate)
+        pdu_header = _CONNECT_IND | (conn.init_addr_type << 6) | (0 << 7)
+
+        frame = _CONNECT_IND_FRAME.pack(
+            BLE_ADV_ACCESS_ADDR, pdu_header, CONNECT_IND_PDU_LEN,
+            conn.init_addr,  # InitA
+            conn.adv_addr,  # AdvA
+            conn.access_addr,  # AA
+            (conn.crc_init & 0xFFFFFF).to_bytes(3, 'little'),  # CRCInit
+            conn.win_size, conn.win_offset, conn.interval, conn.latency, conn.timeout,
+            conn.channel_map,  # ChM (5 bytes)
+            (conn.hop_increment & 0x1F) | (0 << 5),  # Hop + SCA
+        )
 
         # Send on advertising channel
         self._send_to_renode(37, frame)
-        print(f"  [TX] CONNECT_IND sent, {len(frame)} bytes")
+        logger.info("  [TX] CONNECT_IND sent, %d bytes", len(frame))
 
-    def _send_data_to_renode(self, conn: ConnectionState, pb_flag: int, payload: bytes):
+    def _build_data_frame(self, access_addr: int, header: int,
+                          payload: Union[bytes, memoryview]) -> memoryview:
+        """Build a data channel frame in the shared TX buffer.
+
+        The returned view is only valid until the next call.
+        """
+        # [Access Addr:4][Header:2][Payload:N][CRC:3]
+        end = 6 + len(payload)
+        buf = self._tx_buf
+        _DATA_PDU_HDR.pack_into(buf, 0, access_addr, header)
+        buf[6:end] = payload
+        buf[end:end + 3] = b'\x00\x00\x00'  # Placeholder CRC
+        return self._tx_mv[:end + 3]
+
+    def _send_data_to_renode(self, conn: ConnectionState, pb_flag: int, payload: memoryview):
         """Send data PDU to Renode."""
         # Determine LLID from packet boundary flag
         # pb_flag: 0x02 = first packet (start), 0x01 = continuing
         if pb_flag == 0x02:
-            llid = DataPduLlid.DATA_START
+            llid = _LLID_DATA_START
         else:
-            llid = DataPduLlid.DATA_CONT
+            llid = _LLID_DATA_CONT
 
         # Build data PDU header
         # [LLID:2][NESN:1][SN:1][MD:1][RFU:3][Length:8]
-        header = (llid & 0x03)
-        header |= (conn.tx_nesn & 0x01) << 2
-        header |= (conn.tx_sn & 0x01) << 3
-        header |= (0 & 0x01) << 4  # MD = 0
-        header |= (len(payload) & 0xFF) << 8
-
-        # Build frame
-        frame = struct.pack('<I', conn.access_addr)
-        frame += struct.pack('<H', header)
-        frame += payload
-        frame += b'\x00\x00\x00'  # Placeholder CRC
+        # MD = 0
+        header = (llid
+                  | (conn.tx_nesn & 0x01) << 2
+                  | (conn.tx_sn & 0x01) << 3
+                  | (len(payload) & 0xFF) << 8)
+
+        frame = self._build_data_frame(conn.access_addr, header, payload)
 
         # Update sequence numbers
         conn.tx_sn = (conn.tx_sn + 1) & 0x01
@@ -668,93 +791,73 @@ class BLEBridge:
         # Send on data channel
         channel = conn.current_channel
         self._send_to_renode(channel, frame)
-        print(f"  [TX DATA] ch={channel}, llid={llid}, len={len(payload)}")
+        logger.debug("  [TX DATA] ch=%d, llid=%d, len=%d", channel, llid, len(payload))
 
     def _send_ll_terminate_to_renode(self, conn: ConnectionState):
         """Send LL_TERMINATE_IND to Renode."""
         # LL Control PDU with LL_TERMINATE_IND opcode
-        payload = bytes([0x02, 0x13])  # opcode=0x02, error=0x13 (remote user terminated)
+        payload = b'\x02\x13'  # opcode=0x02, error=0x13 (remote user terminated)
 
-        header = DataPduLlid.CONTROL
-        header |= (conn.tx_nesn & 0x01) << 2
-        header |= (conn.tx_sn & 0x01) << 3
-        header |= (len(payload) & 0xFF) << 8
-
-        frame = struct.pack('<I', conn.access_addr)
-        frame += struct.pack('<H', header)
-        frame += payload
-        frame += b'\x00\x00\x00'
+        header = (_LLID_CONTROL
+                  | (conn.tx_nesn & 0x01) << 2
+                  | (conn.tx_sn & 0x01) << 3
+                  | (len(payload) & 0xFF) << 8)
 
+        frame = self._build_data_frame(conn.access_addr, header, payload)
         self._send_to_renode(conn.current_channel, frame)
-        print(f"  [TX LL_TERMINATE_IND]")
+        logger.info("  [TX LL_TERMINATE_IND]")
 
     # =========================================================================
     # HCI Commands
     # =========================================================================
 
-    def _send_hci_command(self, ogf: int, ocf: int, params: bytes = b''):
-        """Send HCI command."""
+    def _send_hci_command(self, packet: bytes):
+        """Send a complete HCI command packet."""
         if self.dry_run or not self.hci_sock:
             return
 
-        opcode = (ogf << 10) | ocf
-        cmd = struct.pack('<HB', opcode, len(params)) + params
-        self.hci_sock.send(b'\x01' + cmd)
+        self.hci_sock.send(packet)
 
     def _set_hci_advertising_data(self, ad_data: bytes):
         """Set advertising data via HCI."""
         if self.dry_run:
-            print(f"  [DRY-RUN] Set advertising data: {ad_data.hex()}")
+            logger.info("  [DRY-RUN] Set advertising data: %s", ad_data.hex())
             return
 
-        # Pad to 31 bytes
-        padded = ad_data[:31].ljust(31, b'\x00')
-        params = struct.pack('<B', len(ad_data)) + padded
+        # '31s' truncates/zero-pads to 31 bytes
+        _HCI_ADV_DATA.pack_into(self._adv_data_cmd, _HCI_CMD_HDR.size, len(ad_data), ad_data)
 
-        self._send_hci_command(0x08, 0x0008, params)
-        print(f"  [HCI] Set advertising data ({len(ad_data)} bytes)")
+        self._send_hci_command(self._adv_data_cmd)
+        logger.info("  [HCI] Set advertising data (%d bytes)", len(ad_data))
 
     def _set_hci_scan_response_data(self, data: bytes):
         """Set scan response data via HCI."""
         if self.dry_run:
-            print(f"  [DRY-RUN] Set scan response data: {data.hex()}")
+            logger.info("  [DRY-RUN] Set scan response data: %s", data.hex())
             return
 
-        padded = data[:31].ljust(31, b'\x00')
-        params = struct.pack('<B', len(data)) + padded
+        _HCI_ADV_DATA.pack_into(self._scan_rsp_cmd, _HCI_CMD_HDR.size, len(data), data)
 
-        self._send_hci_command(0x08, 0x0009, params)
-        print(f"  [HCI] Set scan response data ({len(data)} bytes)")
+        self._send_hci_command(self._scan_rsp_cmd)
+        logger.info("  [HCI] Set scan response data (%d bytes)", len(data))
 
     def _set_hci_advertising_params(self):
         """Set advertising parameters via HCI."""
         if self.dry_run:
-            print(f"  [DRY-RUN] Set advertising parameters")
+            logger.info("  [DRY-RUN] Set advertising parameters")
             return
 
-        params = struct.pack('<HHBBB6sBB',
-            0x0100,     # min_interval (160ms)
-            0x0100,     # max_interval (160ms)
-            0x00,       # ADV_IND (connectable undirected)
-            0x00,       # Own address type (public)
-            0x00,       # Peer address type
-            b'\x00' * 6,  # Peer address
-            0x07,       # All advertising channels
-            0x00        # Filter policy
-        )
-
-        self._send_hci_command(0x08, 0x0006, params)
-        print(f"  [HCI] Set advertising parameters")
+        self._send_hci_command(_LE_SET_ADV_PARAMS_CMD)
+        logger.info("  [HCI] Set advertising parameters")
 
     def _enable_hci_advertising(self, enable: bool):
         """Enable/disable advertising via HCI."""
         if self.dry_run:
-            print(f"  [DRY-RUN] {'Enable' if enable else 'Disable'} advertising")
+            logger.info("  [DRY-RUN] %s advertising", 'Enable' if enable else 'Disable')
             return
 
-        params = struct.pack('<B', 0x01 if enable else 0x00)
-        self._send_hci_command(0x08, 0x000A, params)
-        print(f"  [HCI] {'Enabled' if enable else 'Disabled'} advertising")
+        self._send_hci_command(_LE_SET_ADV_ENABLE_CMD[enable])
+        logger.info("  [HCI] %s advertising", 'Enabled' if enable else 'Disabled')
 
 
 # =============================================================================
@@ -771,8 +874,23 @@ def main():
                         help='HCI device number (default: 0 for hci0)')
     parser.add_argument('--dry-run', action='store_true',
                         help='Run without BlueZ connection')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Log every frame (RX/TX, LL control, HCI ACL)')
+    parser.add_argument('--cpu', type=int, default=None,
+                        help='Pin the bridge to this CPU core (default: no pinning)')
     args = parser.parse_args()
 
+    logging.basicConfig(format='%(message)s', stream=sys.stdout,
+                        level=logging.DEBUG if args.verbose else logging.INFO)
+
+    if args.cpu is not None:
+        # Keep the bridge process from migrating between cores
+        try:
+            os.sched_setaffinity(0, {args.cpu})
+            logger.info("[INFO] Pinned to CPU %d", args.cpu)
+        except (AttributeError, OSError, ValueError, OverflowError) as e:
+            logger.warning("[WARN] Failed to pin to CPU %d: %s", args.cpu, e)
+
     bridge = BLEBridge(
         renode_rx_port=args.renode_rx_port,
         renode_tx_port=args.renode_tx_port,